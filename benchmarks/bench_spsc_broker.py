@@ -0,0 +1,62 @@
+from threading import Thread
+from typing import Dict, Text, Type
+import argparse
+import time
+
+from mqflow.broker import BrokerBase, QueueBroker, SPSCBroker
+from mqflow.consumer import Consumer
+from mqflow.pipeline import SequentialMessageQueue
+from mqflow.producer import Producer
+
+
+def bench_raw(broker: "BrokerBase", count: int) -> float:
+    def produce():
+        for i in range(count):
+            broker.put(i)
+
+    def consume():
+        for _ in range(count):
+            broker.get()
+            broker.task_done()
+
+    threads = [Thread(target=produce), Thread(target=consume)]
+    time_start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - time_start
+
+
+def bench_pipeline(broker: "BrokerBase", count: int) -> float:
+    mq = SequentialMessageQueue(
+        producers=[Producer(target=lambda: 1, max_count=count)],
+        consumers=[Consumer(target=lambda *args: None, max_count=count)],
+        broker=broker,
+    )
+    time_start = time.perf_counter()
+    mq.run()
+    return time.perf_counter() - time_start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="QueueBroker vs SPSCBroker (1:1)")
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--maxsize", type=int, default=1024)
+    args = parser.parse_args()
+
+    brokers: Dict[Text, Type[BrokerBase]] = {
+        "QueueBroker": QueueBroker,
+        "SPSCBroker": SPSCBroker,
+    }
+    for bench in (bench_raw, bench_pipeline):
+        for name, broker_cls in brokers.items():
+            elapsed = bench(broker_cls(maxsize=args.maxsize), args.count)
+            print(
+                f"{bench.__name__:<15} {name:<12} "
+                + f"{args.count / elapsed:>12,.0f} msgs/sec ({elapsed:.3f}s)"
+            )
+
+
+if __name__ == "__main__":
+    main()
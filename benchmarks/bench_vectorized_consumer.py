@@ -0,0 +1,45 @@
+import argparse
+import time
+
+import numpy as np
+
+from mqflow.broker import QueueBroker
+from mqflow.consumer import Consumer, VectorizedConsumer
+
+
+def bench(consumer, count: int, width: int) -> float:
+    # Prefill the broker so only the consume side is measured.
+    broker = QueueBroker()
+    payload = np.arange(width, dtype=np.float64)
+    for _ in range(count):
+        broker.put(payload)
+
+    time_start = time.perf_counter()
+    consumer.listen(broker=broker, result_broker=QueueBroker())
+    return time.perf_counter() - time_start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-item vs vectorized consumer")
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--width", type=int, default=16)
+    parser.add_argument("--batch-size", type=int, default=256)
+    args = parser.parse_args()
+
+    consumers = {
+        "Consumer": Consumer(
+            target=lambda item, *_: np.sqrt(item * 2.0 + 1.0), max_count=args.count
+        ),
+        "VectorizedConsumer": VectorizedConsumer(
+            target=lambda batch, *_: np.sqrt(batch * 2.0 + 1.0),
+            max_count=args.count,
+            max_batch_size=args.batch_size,
+        ),
+    }
+    for name, consumer in consumers.items():
+        elapsed = bench(consumer, args.count, args.width)
+        print(f"{name:<20} {args.count / elapsed:>12,.0f} msgs/sec ({elapsed:.3f}s)")
+
+
+if __name__ == "__main__":
+    main()
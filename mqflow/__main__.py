@@ -0,0 +1,6 @@
+import sys
+
+from mqflow.cli import main
+
+
+sys.exit(main())
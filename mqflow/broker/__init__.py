@@ -1,8 +1,16 @@
 from .base import BrokerBase, MPQueueBroker, QueueBroker
+from .dedup import DedupBroker
+from .delay import DelayBroker
+from .multi import MultiBroker
+from .spsc import SPSCBroker
 
 
 __all__ = [
     "BrokerBase",
+    "DedupBroker",
+    "DelayBroker",
     "MPQueueBroker",
+    "MultiBroker",
     "QueueBroker",
+    "SPSCBroker",
 ]
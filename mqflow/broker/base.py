@@ -1,8 +1,10 @@
 from abc import ABC
-from multiprocessing import Queue as MPQueue
+from collections import deque
+from multiprocessing import JoinableQueue as MPJoinableQueue, Queue as MPQueue
+from multiprocessing.reduction import ForkingPickler
 from numbers import Number
 from queue import Queue, Empty as QueueEmpty, Full as QueueFull
-from typing import Generic, Optional, Text, TypeVar
+from typing import Callable, Deque, Generic, List, Optional, Text, TypeVar
 
 from mqflow.exceptions import FullError, EmptyError
 
@@ -11,6 +13,9 @@ T = TypeVar("T")
 
 
 class BrokerBase(ABC, Generic[T]):
+    # Whether every put is reported to the subscribed ready callbacks.
+    notifies_ready: bool = True
+
     def __init__(
         self,
         maxsize: int = 0,
@@ -25,6 +30,8 @@ class BrokerBase(ABC, Generic[T]):
         self.block = block
         self.timeout = timeout
 
+        self._ready_callbacks: List[Callable[[], None]] = []
+
     def __repr__(self) -> Text:
         return f"{self.__class__.__name__}(name={self.name}, maxsize={self.maxsize})"
 
@@ -81,6 +88,31 @@ class BrokerBase(ABC, Generic[T]):
     def close(self) -> None:
         pass
 
+    def next_due_in(self) -> Optional[float]:
+        return None
+
+    def release_producer(self) -> None:
+        pass
+
+    def release_consumer(self) -> None:
+        pass
+
+    def requeue(self) -> None:
+        pass
+
+    def subscribe(self, callback: Callable[[], None]) -> None:
+        self._ready_callbacks.append(callback)
+
+    def unsubscribe(self, callback: Callable[[], None]) -> None:
+        try:
+            self._ready_callbacks.remove(callback)
+        except ValueError:
+            pass
+
+    def _notify_ready(self) -> None:
+        for callback in self._ready_callbacks:
+            callback()
+
 
 class QueueBroker(BrokerBase[T]):
     def __init__(
@@ -140,6 +172,8 @@ class QueueBroker(BrokerBase[T]):
             raise FullError(e)
         except Exception as e:
             raise e
+        if self._ready_callbacks:
+            self._notify_ready()
 
     def put_nowait(self, item: T) -> None:
         try:
@@ -148,6 +182,8 @@ class QueueBroker(BrokerBase[T]):
             raise FullError(e)
         except Exception as e:
             raise e
+        if self._ready_callbacks:
+            self._notify_ready()
 
     def qsize(self) -> int:
         return self.queue.qsize()
@@ -160,6 +196,9 @@ class QueueBroker(BrokerBase[T]):
 
 
 class MPQueueBroker(QueueBroker[T]):
+    # Puts from other processes cannot reach the callbacks of this process.
+    notifies_ready: bool = False
+
     def __init__(
         self,
         maxsize: int = 0,
@@ -168,15 +207,82 @@ class MPQueueBroker(QueueBroker[T]):
         block: bool = True,
         timeout: Optional[Number] = None,
         queue: Optional["MPQueue[T]"] = None,
+        prefetch: int = 1,
         **kwargs,
     ):
         super().__init__(
             maxsize, *args, name=name, block=block, timeout=timeout, kwargs=kwargs
         )
 
-        self.queue = queue or MPQueue(maxsize=maxsize)
+        self.queue = queue or MPJoinableQueue(maxsize=maxsize)
         self.maxsize = self.queue._maxsize
+        self.prefetch = max(1, int(prefetch))
+
+        self._buffer: Deque[T] = deque()
+
+    def __getstate__(self):
+        # Prefetched items belong to this process, never ship them to a child.
+        state = self.__dict__.copy()
+        state["_buffer"] = deque()
+        state["_ready_callbacks"] = []
+        return state
+
+    def empty(self) -> bool:
+        return not self._buffer and self.queue.empty()
+
+    def get(self, block: Optional[bool] = None, timeout: Optional[Number] = None) -> T:
+        try:
+            item = self._buffer.popleft()
+        except IndexError:
+            pass
+        else:
+            # A prefetched item holds its `maxsize` slot until it is handed out.
+            self.queue._sem.release()
+            return item
+
+        item = super().get(block=block, timeout=timeout)
+        if self.prefetch > 1:
+            self._prefetch(self.prefetch - 1)
+        return item
+
+    def get_nowait(self) -> T:
+        return self.get(block=False)
+
+    def qsize(self) -> int:
+        # Prefetched items still hold their slots, so the queue counts them.
+        return self.queue.qsize()
+
+    def requeue(self) -> None:
+        # Hand items back on the slots they still hold instead of `put()`,
+        # which could block forever once producers have filled the queue.
+        # They also stay counted as unfinished, so `join()` is unaffected.
+        queue = self.queue
+        with queue._notempty:
+            while self._buffer:
+                try:
+                    item = self._buffer.popleft()
+                except IndexError:
+                    break
+                if queue._thread is None:
+                    queue._start_thread()
+                queue._buffer.append(item)
+                queue._notempty.notify()
 
     def close(self) -> None:
+        self.requeue()
         self.queue.close()
         self.queue.join_thread()
+
+    def _prefetch(self, count: int) -> None:
+        # Drain up to `count` ready messages while holding the reader lock once,
+        # and give up immediately if another consumer is reading.
+        queue = self.queue
+        if not queue._rlock.acquire(False):
+            return
+        payloads: List[bytes] = []
+        try:
+            while len(payloads) < count and queue._poll():
+                payloads.append(queue._recv_bytes())
+        finally:
+            queue._rlock.release()
+        self._buffer.extend(ForkingPickler.loads(payload) for payload in payloads)
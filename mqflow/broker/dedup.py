@@ -0,0 +1,151 @@
+from numbers import Number
+from typing import Any, Callable, Hashable, Optional, Text, TypeVar
+import time
+
+from mqflow.broker.base import BrokerBase
+from mqflow.utils.cache import TTLCache
+
+
+T = TypeVar("T")
+
+
+class DedupBroker(BrokerBase[T]):
+    def __init__(
+        self,
+        broker: "BrokerBase[T]",
+        *args,
+        name: Text = "DedupBroker",
+        key: Optional[Callable[[T], Hashable]] = None,
+        cache_maxsize: int = 1_000_000,
+        ttl: Optional[Number] = None,
+        cache: Optional["TTLCache"] = None,
+        **kwargs,
+    ):
+        super().__init__(
+            broker.maxsize,
+            *args,
+            name=name,
+            block=broker.block,
+            timeout=broker.timeout,
+            **kwargs,
+        )
+
+        self.broker = broker
+        self.notifies_ready = broker.notifies_ready
+        self.key = key or _identity
+        # Each cached key costs about 35 bytes plus the key object, see TTLCache.
+        self.cache = (
+            TTLCache(maxsize=cache_maxsize, ttl=ttl) if cache is None else cache
+        )
+
+    def __repr__(self) -> Text:
+        return (
+            f"{self.__class__.__name__}(name={self.name}, broker={self.broker}, "
+            + f"hits={self.hits}, misses={self.misses})"
+        )
+
+    @property
+    def hits(self) -> int:
+        return self.cache.hits
+
+    @property
+    def misses(self) -> int:
+        return self.cache.misses
+
+    def empty(self) -> bool:
+        return self.broker.empty()
+
+    def full(self) -> bool:
+        return self.broker.full()
+
+    def get(self, block: Optional[bool] = None, timeout: Optional[Number] = None) -> T:
+        block = self.block if block is None else block
+        timeout = self.timeout if timeout is None else timeout
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            if deadline is not None:
+                timeout = max(0.0, deadline - time.monotonic())
+            item = self.broker.get(block=block, timeout=timeout)
+            if self._is_new(item):
+                return item
+            # Duplicates never reach the consumer, so acknowledge them here.
+            self.broker.task_done()
+
+    def get_nowait(self) -> T:
+        while True:
+            item = self.broker.get_nowait()
+            if self._is_new(item):
+                return item
+            self.broker.task_done()
+
+    def join(self) -> None:
+        self.broker.join()
+
+    def put(
+        self, item: T, block: Optional[bool] = None, timeout: Optional[Number] = None
+    ) -> None:
+        self._check_hashable(item)
+        self.broker.put(item, block=block, timeout=timeout)
+
+    def put_nowait(self, item: T) -> None:
+        self._check_hashable(item)
+        self.broker.put_nowait(item)
+
+    def qsize(self) -> int:
+        return self.broker.qsize()
+
+    def task_done(self) -> None:
+        self.broker.task_done()
+
+    def close(self) -> None:
+        self.broker.close()
+
+    def next_due_in(self) -> Optional[float]:
+        return self.broker.next_due_in()
+
+    def release_producer(self) -> None:
+        self.broker.release_producer()
+
+    def release_consumer(self) -> None:
+        self.broker.release_consumer()
+
+    def requeue(self) -> None:
+        self.broker.requeue()
+
+    def subscribe(self, callback: Callable[[], None]) -> None:
+        self.broker.subscribe(callback)
+
+    def unsubscribe(self, callback: Callable[[], None]) -> None:
+        self.broker.unsubscribe(callback)
+
+    def _check_hashable(self, item: T) -> None:
+        # Without a `key`, reject unhashable messages before they are enqueued.
+        if self.key is not _identity:
+            return
+        try:
+            hash(item)
+        except TypeError as e:
+            raise _unhashable_error(item) from e
+
+    def _is_new(self, item: T) -> bool:
+        try:
+            return self.cache.add(self.key(item))
+        except Exception as e:
+            # The message has left the inner broker, acknowledge it so that
+            # `join()` does not wait on it forever.
+            self.broker.task_done()
+            if isinstance(e, TypeError):
+                raise _unhashable_error(item) from e
+            raise
+
+
+def _identity(item: T) -> T:
+    return item
+
+
+def _unhashable_error(item: Any) -> TypeError:
+    return TypeError(
+        f"Cannot deduplicate unhashable {type(item).__name__} message, "
+        + "pass a `key` callable returning a hashable value"
+    )
@@ -0,0 +1,155 @@
+from itertools import count as itertools_count
+from numbers import Number
+from typing import List, Optional, Text, Tuple, TypeVar
+import heapq
+import threading
+import time
+
+from mqflow.broker.base import BrokerBase
+from mqflow.exceptions import EmptyError, FullError
+
+
+T = TypeVar("T")
+
+
+class DelayBroker(BrokerBase[T]):
+    def __init__(
+        self,
+        maxsize: int = 0,
+        *args,
+        name: Text = "DelayBroker",
+        block: bool = True,
+        timeout: Optional[Number] = None,
+        **kwargs,
+    ):
+        super().__init__(
+            maxsize, *args, name=name, block=block, timeout=timeout, **kwargs
+        )
+
+        self._heap: List[Tuple[float, int, T]] = []
+        self._sequence = itertools_count()
+        self._unfinished_tasks = 0
+        self._mutex = threading.Lock()
+        self._not_empty = threading.Condition(self._mutex)
+        self._not_full = threading.Condition(self._mutex)
+        self._all_tasks_done = threading.Condition(self._mutex)
+
+    def empty(self) -> bool:
+        return self.qsize() == 0
+
+    def full(self) -> bool:
+        with self._mutex:
+            return 0 < self.maxsize <= len(self._heap)
+
+    def ready_size(self) -> int:
+        now = time.monotonic()
+        with self._mutex:
+            return sum(1 for due, _, _ in self._heap if due <= now)
+
+    def get(self, block: Optional[bool] = None, timeout: Optional[Number] = None) -> T:
+        block = self.block if block is None else block
+        timeout = self.timeout if timeout is None else timeout
+        if timeout is not None and timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self._not_empty:
+            while True:
+                now = time.monotonic()
+                if self._heap and self._heap[0][0] <= now:
+                    _, _, item = heapq.heappop(self._heap)
+                    self._not_full.notify()
+                    return item
+                if not block:
+                    raise EmptyError()
+
+                # Sleep until the earliest message is due or a new one is put.
+                wait = self._heap[0][0] - now if self._heap else None
+                if deadline is not None:
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        raise EmptyError()
+                    wait = remaining if wait is None else min(wait, remaining)
+                self._not_empty.wait(wait)
+
+    def get_nowait(self) -> T:
+        return self.get(block=False)
+
+    def join(self) -> None:
+        with self._all_tasks_done:
+            while self._unfinished_tasks:
+                self._all_tasks_done.wait()
+
+    def put(
+        self,
+        item: T,
+        block: Optional[bool] = None,
+        timeout: Optional[Number] = None,
+        delay: Optional[Number] = None,
+        deliver_at: Optional[Number] = None,
+    ) -> None:
+        block = self.block if block is None else block
+        timeout = self.timeout if timeout is None else timeout
+        if delay is not None and deliver_at is not None:
+            raise ValueError("Only one of 'delay' and 'deliver_at' can be set")
+
+        now = time.monotonic()
+        if deliver_at is not None:
+            # `deliver_at` is a wall clock timestamp, schedule on the monotonic clock.
+            due = now + (deliver_at - time.time())
+        else:
+            due = now + (delay or 0.0)
+
+        with self._not_full:
+            if self.maxsize > 0:
+                if not block:
+                    if len(self._heap) >= self.maxsize:
+                        raise FullError()
+                elif timeout is None:
+                    while len(self._heap) >= self.maxsize:
+                        self._not_full.wait()
+                elif timeout < 0:
+                    raise ValueError("'timeout' must be a non-negative number")
+                else:
+                    deadline = now + timeout
+                    while len(self._heap) >= self.maxsize:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise FullError()
+                        self._not_full.wait(remaining)
+
+            heapq.heappush(self._heap, (due, next(self._sequence), item))
+            self._unfinished_tasks += 1
+            self._not_empty.notify()
+        if self._ready_callbacks:
+            self._notify_ready()
+
+    def put_nowait(
+        self,
+        item: T,
+        delay: Optional[Number] = None,
+        deliver_at: Optional[Number] = None,
+    ) -> None:
+        self.put(item, block=False, delay=delay, deliver_at=deliver_at)
+
+    def next_due_in(self) -> Optional[float]:
+        with self._mutex:
+            if not self._heap:
+                return None
+            return max(0.0, self._heap[0][0] - time.monotonic())
+
+    def qsize(self) -> int:
+        with self._mutex:
+            return len(self._heap)
+
+    def task_done(self) -> None:
+        with self._all_tasks_done:
+            unfinished = self._unfinished_tasks - 1
+            if unfinished < 0:
+                raise ValueError("task_done() called too many times")
+            if unfinished == 0:
+                self._all_tasks_done.notify_all()
+            self._unfinished_tasks = unfinished
+
+    def close(self) -> None:
+        pass
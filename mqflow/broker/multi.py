@@ -0,0 +1,181 @@
+from collections import deque
+from numbers import Number
+from typing import Deque, List, Optional, Sequence, Text, Tuple, TypeVar
+import threading
+import time
+
+from mqflow.broker.base import BrokerBase
+from mqflow.exceptions import EmptyError
+
+
+T = TypeVar("T")
+
+
+class MultiBroker(BrokerBase[T]):
+    def __init__(
+        self,
+        brokers: Sequence["BrokerBase[T]"],
+        weights: Optional[Sequence[Number]] = None,
+        *args,
+        name: Text = "MultiBroker",
+        block: bool = True,
+        timeout: Optional[Number] = None,
+        poll_interval: Number = 0.05,
+        **kwargs,
+    ):
+        if not brokers:
+            raise ValueError("At least one broker is required")
+        weights = [1] * len(brokers) if weights is None else list(weights)
+        if len(weights) != len(brokers):
+            raise ValueError("The weights must match the brokers one to one")
+        if any(weight <= 0 for weight in weights):
+            raise ValueError("The weights must be positive numbers")
+
+        super().__init__(0, *args, name=name, block=block, timeout=timeout, **kwargs)
+
+        self.brokers: List["BrokerBase[T]"] = list(brokers)
+        self.weights: List[Number] = weights
+        self.poll_interval = poll_interval
+        self.notifies_ready = all(broker.notifies_ready for broker in self.brokers)
+
+        self._current: List[Number] = [0] * len(self.brokers)
+        self._schedule_lock = threading.Lock()
+        self._ready = threading.Condition()
+        self._ready_version = 0
+        self._sources = threading.local()
+
+        for broker in self.brokers:
+            broker.subscribe(self._on_ready)
+
+    def __repr__(self) -> Text:
+        brokers = ", ".join(broker.name for broker in self.brokers)
+        return f"{self.__class__.__name__}(name={self.name}, brokers=[{brokers}])"
+
+    def empty(self) -> bool:
+        return all(broker.empty() for broker in self.brokers)
+
+    def full(self) -> bool:
+        return all(broker.full() for broker in self.brokers)
+
+    def get(self, block: Optional[bool] = None, timeout: Optional[Number] = None) -> T:
+        block = self.block if block is None else block
+        timeout = self.timeout if timeout is None else timeout
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            with self._ready:
+                version = self._ready_version
+            try:
+                broker, item = self._get_ready()
+            except EmptyError:
+                if not block:
+                    raise
+            else:
+                self._source_queue().append(broker)
+                return item
+
+            wait = self._next_wait(deadline)
+            with self._ready:
+                # Only sleep if nothing was put since the brokers were scanned.
+                if self._ready_version == version:
+                    self._ready.wait(wait)
+
+    def get_nowait(self) -> T:
+        return self.get(block=False)
+
+    def join(self) -> None:
+        for broker in self.brokers:
+            broker.join()
+
+    def qsize(self) -> int:
+        return sum(broker.qsize() for broker in self.brokers)
+
+    def task_done(self) -> None:
+        try:
+            broker = self._source_queue().popleft()
+        except IndexError:
+            raise ValueError("task_done() called too many times")
+        broker.task_done()
+
+    def detach(self) -> None:
+        for broker in self.brokers:
+            broker.unsubscribe(self._on_ready)
+
+    def close(self) -> None:
+        self.detach()
+        for broker in self.brokers:
+            broker.close()
+
+    def next_due_in(self) -> Optional[float]:
+        dues = [broker.next_due_in() for broker in self.brokers]
+        dues = [due for due in dues if due is not None]
+        return min(dues) if dues else None
+
+    def release_consumer(self) -> None:
+        for broker in self.brokers:
+            broker.release_consumer()
+
+    def requeue(self) -> None:
+        for broker in self.brokers:
+            broker.requeue()
+
+    def _on_ready(self) -> None:
+        with self._ready:
+            self._ready_version += 1
+            self._ready.notify()
+        if self._ready_callbacks:
+            self._notify_ready()
+
+    def _get_ready(self) -> Tuple["BrokerBase[T]", T]:
+        # Smooth weighted round robin over the brokers that look non-empty,
+        # falling back to the next candidate when one turns out to be empty.
+        with self._schedule_lock:
+            candidates = [
+                index for index, broker in enumerate(self.brokers) if not broker.empty()
+            ]
+            if not candidates:
+                raise EmptyError()
+            total = sum(self.weights[index] for index in candidates)
+            for index in candidates:
+                self._current[index] += self.weights[index]
+            candidates.sort(key=lambda index: self._current[index], reverse=True)
+
+            failed = []
+            for index in candidates:
+                broker = self.brokers[index]
+                try:
+                    item = broker.get_nowait()
+                except EmptyError:
+                    failed.append(index)
+                    continue
+                # Brokers holding nothing ready (e.g. only future deliveries)
+                # must not bank credit, or they starve the others once ready.
+                for failed_index in failed:
+                    self._current[failed_index] -= self.weights[failed_index]
+                    total -= self.weights[failed_index]
+                self._current[index] -= total
+                return broker, item
+
+            for index in candidates:
+                self._current[index] -= self.weights[index]
+            raise EmptyError()
+
+    def _next_wait(self, deadline: Optional[float]) -> Optional[float]:
+        waits = []
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise EmptyError()
+            waits.append(remaining)
+        due_in = self.next_due_in()
+        if due_in is not None:
+            waits.append(due_in)
+        if not self.notifies_ready:
+            waits.append(self.poll_interval)
+        return min(waits) if waits else None
+
+    def _source_queue(self) -> Deque["BrokerBase[T]"]:
+        sources = getattr(self._sources, "queue", None)
+        if sources is None:
+            sources = self._sources.queue = deque()
+        return sources
@@ -0,0 +1,172 @@
+from numbers import Number
+from typing import Any, List, Optional, Text, TypeVar
+import threading
+import time
+
+from mqflow.broker.base import BrokerBase
+from mqflow.exceptions import EmptyError, FullError
+
+
+T = TypeVar("T")
+
+
+# The producer only ever writes `_tail` and the consumer only ever writes `_head`,
+# so the hot path takes no lock; events are only touched when one side waits.
+class SPSCBroker(BrokerBase[T]):
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        *args,
+        name: Text = "SPSCBroker",
+        block: bool = True,
+        timeout: Optional[Number] = None,
+        **kwargs,
+    ):
+        if maxsize <= 0:
+            raise ValueError("SPSCBroker requires a positive 'maxsize'")
+        super().__init__(
+            maxsize, *args, name=name, block=block, timeout=timeout, **kwargs
+        )
+
+        self._slots: List[Any] = [None] * maxsize
+        self._head = 0
+        self._tail = 0
+        self._done = 0
+
+        self._producer_ident: Optional[int] = None
+        self._consumer_ident: Optional[int] = None
+
+        self._consumer_waiting = False
+        self._producer_waiting = False
+        self._joiner_waiting = False
+        self._not_empty = threading.Event()
+        self._not_full = threading.Event()
+        self._all_tasks_done = threading.Event()
+
+    def empty(self) -> bool:
+        return self._tail == self._head
+
+    def full(self) -> bool:
+        return self._tail - self._head >= self.maxsize
+
+    def get(self, block: Optional[bool] = None, timeout: Optional[Number] = None) -> T:
+        block = self.block if block is None else block
+        timeout = self.timeout if timeout is None else timeout
+        ident = threading.get_ident()
+        if self._consumer_ident != ident:
+            self._claim("consumer", ident)
+
+        head = self._head
+        if self._tail == head:
+            if not block:
+                raise EmptyError()
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while self._tail == head:
+                self._not_empty.clear()
+                self._consumer_waiting = True
+                if self._tail == head:
+                    remaining = self._remaining(deadline)
+                    if remaining is not None and remaining <= 0:
+                        self._consumer_waiting = False
+                        raise EmptyError()
+                    self._not_empty.wait(remaining)
+                self._consumer_waiting = False
+
+        index = head % self.maxsize
+        item = self._slots[index]
+        self._slots[index] = None
+        self._head = head + 1
+        if self._producer_waiting:
+            self._not_full.set()
+        return item
+
+    def get_nowait(self) -> T:
+        return self.get(block=False)
+
+    def join(self) -> None:
+        while self._done < self._tail:
+            self._all_tasks_done.clear()
+            self._joiner_waiting = True
+            if self._done < self._tail:
+                self._all_tasks_done.wait()
+            self._joiner_waiting = False
+
+    def put(
+        self, item: T, block: Optional[bool] = None, timeout: Optional[Number] = None
+    ) -> None:
+        block = self.block if block is None else block
+        timeout = self.timeout if timeout is None else timeout
+        ident = threading.get_ident()
+        if self._producer_ident != ident:
+            self._claim("producer", ident)
+
+        tail = self._tail
+        if tail - self._head >= self.maxsize:
+            if not block:
+                raise FullError()
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while tail - self._head >= self.maxsize:
+                self._not_full.clear()
+                self._producer_waiting = True
+                if tail - self._head >= self.maxsize:
+                    remaining = self._remaining(deadline)
+                    if remaining is not None and remaining <= 0:
+                        self._producer_waiting = False
+                        raise FullError()
+                    self._not_full.wait(remaining)
+                self._producer_waiting = False
+
+        self._slots[tail % self.maxsize] = item
+        self._tail = tail + 1
+        if self._consumer_waiting:
+            self._not_empty.set()
+        if self._ready_callbacks:
+            self._notify_ready()
+
+    def put_nowait(self, item: T) -> None:
+        self.put(item, block=False)
+
+    def qsize(self) -> int:
+        return self._tail - self._head
+
+    def task_done(self) -> None:
+        if self._done >= self._tail:
+            raise ValueError("task_done() called too many times")
+        self._done += 1
+        if self._joiner_waiting and self._done >= self._tail:
+            self._all_tasks_done.set()
+
+    def close(self) -> None:
+        pass
+
+    def release_producer(self) -> None:
+        if self._producer_ident == threading.get_ident():
+            self._producer_ident = None
+
+    def release_consumer(self) -> None:
+        if self._consumer_ident == threading.get_ident():
+            self._consumer_ident = None
+
+    def reset(self) -> None:
+        self._producer_ident = None
+        self._consumer_ident = None
+
+    def _claim(self, role: Text, ident: int) -> None:
+        if role == "producer":
+            owner = self._producer_ident
+            if owner is None:
+                self._producer_ident = ident
+                return
+        else:
+            owner = self._consumer_ident
+            if owner is None:
+                self._consumer_ident = ident
+                return
+        raise RuntimeError(
+            f"{self} only supports a single {role}, "
+            + f"but it is already attached to thread {owner}"
+        )
+
+    @staticmethod
+    def _remaining(deadline: Optional[float]) -> Optional[float]:
+        return None if deadline is None else deadline - time.monotonic()
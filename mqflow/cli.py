@@ -0,0 +1,72 @@
+from typing import List, Optional
+import argparse
+import json
+import sys
+
+from mqflow.loadtest import BROKERS, run_load_test
+from mqflow.version import version
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="mqflow")
+    parser.add_argument("--version", action="version", version=version)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    load = subparsers.add_parser(
+        "load", help="Run a load/soak test and print a JSON report"
+    )
+    load.add_argument("--broker", choices=sorted(BROKERS), default="queue")
+    load.add_argument("--producers", type=int, default=1)
+    load.add_argument("--consumers", type=int, default=1)
+    load.add_argument("--message-size", type=int, default=64, help="Payload bytes")
+    load.add_argument(
+        "--rate", type=float, default=0, help="Total msgs/sec, 0 for unlimited"
+    )
+    load.add_argument("--duration", type=float, default=10.0, help="Seconds")
+    load.add_argument("--maxsize", type=int, default=0, help="Broker maxsize")
+    load.add_argument("--drain-timeout", type=float, default=5.0)
+    load.add_argument("--sample-interval", type=float, default=1.0)
+    load.add_argument("--reservoir-size", type=int, default=100_000)
+    load.add_argument(
+        "--reorder-window",
+        type=int,
+        default=100_000,
+        help="Sequences tracked per producer before a gap is given up on",
+    )
+    load.add_argument("--output", default="-", help="Report path, '-' for stdout")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    if args.command == "load":
+        try:
+            report = run_load_test(
+                broker=args.broker,
+                producers=args.producers,
+                consumers=args.consumers,
+                message_size=args.message_size,
+                rate=args.rate,
+                duration=args.duration,
+                maxsize=args.maxsize,
+                drain_timeout=args.drain_timeout,
+                sample_interval=args.sample_interval,
+                reservoir_size=args.reservoir_size,
+                reorder_window=args.reorder_window,
+            )
+        except ValueError as e:
+            print(f"mqflow: error: {e}", file=sys.stderr)
+            return 2
+
+        output = json.dumps(report, indent=2)
+        if args.output == "-":
+            print(output)
+        else:
+            with open(args.output, "w") as f:
+                f.write(output + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,9 @@
 from .base import Consumer, ConsumerBase
+from .vectorized import VectorizedConsumer
 
 
 __all__ = [
     "Consumer",
     "ConsumerBase",
+    "VectorizedConsumer",
 ]
@@ -1,11 +1,26 @@
 from abc import ABC
-from typing import Any, Callable, Dict, Generic, Optional, Text, Tuple, Type, TypeVar
+from numbers import Number
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Optional,
+    Sequence,
+    Text,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 from typing_extensions import ParamSpec
+import copy
 import logging
 import threading
 import time
 
 from mqflow.broker.base import BrokerBase
+from mqflow.broker.multi import MultiBroker
 from mqflow.config import settings
 from mqflow.exceptions import EmptyError
 
@@ -25,6 +40,7 @@ class ConsumerBase(ABC, Generic[P, S, T]):
         block: bool = True,
         timeout: Optional[float] = None,
         max_count: Optional[int] = None,
+        result_broker: Optional[Type[BrokerBase[S]]] = None,
         **init_kwargs,
     ):
         self.name = name
@@ -34,50 +50,101 @@ class ConsumerBase(ABC, Generic[P, S, T]):
             self.max_count = None
         self.block = block
         self.timeout = timeout
+        self.result_broker = result_broker
 
         self._count = 0
         self._stop_event = threading.Event()
+        self._resume_event = threading.Event()
+        self._resume_event.set()
 
     def listen(
         self,
-        broker: Type[BrokerBase[T]],
+        broker: Union[Type[BrokerBase[T]], Sequence[Type[BrokerBase[T]]]],
         *args,
         block: Optional[bool] = None,
         timeout: Optional[float] = None,
         max_count: Optional[int] = None,
+        result_broker: Optional[Type[BrokerBase[S]]] = None,
+        weights: Optional[Sequence[Number]] = None,
         **kwargs,
     ):
+        if isinstance(broker, (list, tuple)):
+            multi_broker = MultiBroker(broker, weights=weights)
+            try:
+                return self.listen(
+                    multi_broker,
+                    *args,
+                    block=block,
+                    timeout=timeout,
+                    max_count=max_count,
+                    result_broker=result_broker,
+                    **kwargs,
+                )
+            finally:
+                multi_broker.detach()
+
         block = self.block if block is None else block
         timeout = self.timeout if timeout is None else timeout
         max_count = self.max_count if max_count is None else max_count
+        result_broker = self.result_broker if result_broker is None else result_broker
 
         count = 0
         time_start = time.time()
-        while self.is_stop() is False and (
-            self.max_count is None or count < self.max_count
-        ):
-            try:
-                item = broker.get(block=block, timeout=1.0)
-            except EmptyError as e:
-                if timeout is not None and time.time() - time_start > timeout:
+        try:
+            while self.is_stop() is False and (max_count is None or count < max_count):
+                self._resume_event.wait()
+                if self.is_stop():
+                    break
+
+                try:
+                    item = broker.get(block=block, timeout=1.0)
+                except EmptyError as e:
+                    if timeout is not None and time.time() - time_start > timeout:
+                        self.stop()
+                        raise e
+                    continue
+                except KeyboardInterrupt:
                     self.stop()
-                    raise e
-                continue
-            except KeyboardInterrupt:
-                self.stop()
-                return
-            except Exception as e:
-                logger.exception(e)
-                self.stop()
-                return
-
-            self.consume(item, broker)
-            broker.task_done()
+                    return
+                except Exception as e:
+                    logger.exception(e)
+                    self.stop()
+                    return
+
+                limit = None if max_count is None else max_count - count
+                try:
+                    handled = self.handle(
+                        item, broker, result_broker=result_broker, limit=limit
+                    )
+                except Exception:
+                    self.stop()
+                    raise
+
+                count += handled
+                self.count_add(handled)
+        finally:
+            # Hand back anything prefetched but not consumed before stopping.
+            broker.requeue()
+            broker.release_consumer()
 
-            count += 1
-            self.count_add_one()
+    def handle(
+        self,
+        item: T,
+        broker: Type[BrokerBase[T]],
+        result_broker: Optional[Type[BrokerBase[S]]] = None,
+        limit: Optional[int] = None,
+    ) -> int:
+        # Process one received message and return how many messages were
+        # consumed and acknowledged, subclasses may pull more up to `limit`.
+        try:
+            result = self.consume(item, broker)
+            if result_broker is not None:
+                result_broker.put(result)
+        finally:
+            broker.task_done()
+        return 1
 
-    def consume(self, item: T, broker: Type[BrokerBase[T]], *args, **kwargs) -> None:
+    def consume(self, item: T, broker: Type[BrokerBase[T]], *args, **kwargs) -> S:
         raise NotImplementedError
 
     @property
@@ -87,12 +154,35 @@ class ConsumerBase(ABC, Generic[P, S, T]):
     def count_add_one(self) -> None:
         self._count += 1
 
+    def count_add(self, number: int) -> None:
+        self._count += number
+
     def stop(self) -> None:
         self._stop_event.set()
+        self._resume_event.set()
 
     def is_stop(self) -> bool:
         return self._stop_event.is_set()
 
+    def pause(self) -> None:
+        if not self.is_stop():
+            self._resume_event.clear()
+
+    def resume(self) -> None:
+        self._resume_event.set()
+
+    def is_paused(self) -> bool:
+        return not self._resume_event.is_set()
+
+    def clone(self, name: Optional[Text] = None):
+        worker = copy.copy(self)
+        worker.name = self.name if name is None else name
+        worker._count = 0
+        worker._stop_event = threading.Event()
+        worker._resume_event = threading.Event()
+        worker._resume_event.set()
+        return worker
+
 
 class Consumer(ConsumerBase[P, S, T]):
     def __init__(
@@ -105,6 +195,7 @@ class Consumer(ConsumerBase[P, S, T]):
         block: bool = True,
         timeout: Optional[float] = None,
         max_count: Optional[int] = None,
+        result_broker: Optional[Type[BrokerBase[S]]] = None,
         **init_kwargs,
     ):
         super().__init__(
@@ -113,6 +204,7 @@ class Consumer(ConsumerBase[P, S, T]):
             block=block,
             timeout=timeout,
             max_count=max_count,
+            result_broker=result_broker,
             **init_kwargs,
         )
 
@@ -120,5 +212,5 @@ class Consumer(ConsumerBase[P, S, T]):
         self.args = args
         self.kwargs = kwargs or {}
 
-    def consume(self, item: T, broker: Type[BrokerBase[T]], *args, **kwargs) -> None:
-        self.target(item, broker, *self.args, **self.kwargs)
+    def consume(self, item: T, broker: Type[BrokerBase[T]], *args, **kwargs) -> S:
+        return self.target(item, broker, *self.args, **self.kwargs)
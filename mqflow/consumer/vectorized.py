@@ -0,0 +1,126 @@
+from numbers import Number
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    TYPE_CHECKING,
+    Text,
+    Tuple,
+    Type,
+    TypeVar,
+)
+from typing_extensions import ParamSpec
+import time
+
+from mqflow.broker.base import BrokerBase
+from mqflow.consumer.base import ConsumerBase
+from mqflow.exceptions import EmptyError
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if TYPE_CHECKING:
+    import numpy
+
+
+P = ParamSpec("P")
+S = TypeVar("S")
+T = TypeVar("T")
+
+
+class VectorizedConsumer(ConsumerBase[P, S, T]):
+    def __init__(
+        self,
+        target: Callable[..., "numpy.ndarray"],
+        args: Tuple[Any, ...] = (),
+        kwargs: Optional[Dict[Text, Any]] = None,
+        *init_args,
+        name: Text = "VectorizedConsumer",
+        block: bool = True,
+        timeout: Optional[float] = None,
+        max_count: Optional[int] = None,
+        result_broker: Optional[Type[BrokerBase[S]]] = None,
+        max_batch_size: int = 64,
+        max_latency_seconds: Number = 0.01,
+        dtype: Optional[Any] = None,
+        **init_kwargs,
+    ):
+        if np is None:
+            raise ImportError(
+                "VectorizedConsumer requires numpy, "
+                + "install it with `pip install mqflow[numpy]`"
+            )
+        if max_batch_size <= 0:
+            raise ValueError("The max_batch_size must be a positive integer")
+
+        super().__init__(
+            name=name,
+            *init_args,
+            block=block,
+            timeout=timeout,
+            max_count=max_count,
+            result_broker=result_broker,
+            **init_kwargs,
+        )
+
+        self.target = target
+        self.args = args
+        self.kwargs = kwargs or {}
+        self.max_batch_size = int(max_batch_size)
+        self.max_latency_seconds = max_latency_seconds
+        self.dtype = dtype
+
+    def handle(
+        self,
+        item: T,
+        broker: Type[BrokerBase[T]],
+        result_broker: Optional[Type[BrokerBase[S]]] = None,
+        limit: Optional[int] = None,
+    ) -> int:
+        limit = (
+            self.max_batch_size if limit is None else min(self.max_batch_size, limit)
+        )
+        items = [item]
+        try:
+            self._collect(broker, items, limit)
+            results = self.consume(self._stack(items), broker)
+            if result_broker is not None and results is not None:
+                if len(results) != len(items):
+                    raise ValueError(
+                        f"The target returned {len(results)} results "
+                        + f"for a batch of {len(items)} messages"
+                    )
+                for result in results:
+                    result_broker.put(result)
+        finally:
+            # Acknowledge the whole batch so `join()` never waits on it.
+            for _ in items:
+                broker.task_done()
+        return len(items)
+
+    def consume(
+        self, batch: "numpy.ndarray", broker: Type[BrokerBase[T]], *args, **kwargs
+    ) -> Optional["numpy.ndarray"]:
+        return self.target(batch, broker, *self.args, **self.kwargs)
+
+    def _collect(
+        self, broker: Type[BrokerBase[T]], items: List[T], limit: int
+    ) -> List[T]:
+        deadline = time.monotonic() + self.max_latency_seconds
+        while len(items) < limit:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining > 0:
+                    items.append(broker.get(block=True, timeout=remaining))
+                else:
+                    items.append(broker.get_nowait())
+            except EmptyError:
+                break
+        return items
+
+    def _stack(self, items: List[T]) -> "numpy.ndarray":
+        return np.stack([np.asarray(item, dtype=self.dtype) for item in items])
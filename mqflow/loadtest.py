@@ -0,0 +1,250 @@
+from itertools import count as itertools_count
+from numbers import Number
+from threading import Thread
+from typing import Any, Callable, Dict, List, Optional, Set, Text, Tuple
+import os
+import random
+import sys
+import threading
+import time
+
+from mqflow.broker import BrokerBase, MPQueueBroker, QueueBroker, SPSCBroker
+from mqflow.consumer import Consumer
+from mqflow.pipeline import SequentialMessageQueue
+from mqflow.producer import Producer
+
+
+Message = Tuple[int, int, int, bytes]
+
+BROKERS: Dict[Text, Callable[..., BrokerBase]] = {
+    "queue": QueueBroker,
+    "mp": MPQueueBroker,
+    "spsc": SPSCBroker,
+}
+
+
+def rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        # Fall back to the peak RSS, which is reported in bytes on macOS.
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def percentile(sorted_values: List[float], q: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(q / 100 * len(sorted_values)))
+    return sorted_values[index]
+
+
+class LoadRecorder:
+    def __init__(
+        self,
+        producers: int,
+        reservoir_size: int = 100_000,
+        reorder_window: int = 100_000,
+    ):
+        if reorder_window <= 0:
+            raise ValueError("The reorder_window must be a positive integer")
+
+        self.reservoir_size = reservoir_size
+        self.reorder_window = reorder_window
+        self.consumed = 0
+        self.unique = 0
+        self.duplicated = 0
+        self.gaps = 0
+        self.latency_max = 0.0
+        self.latency_sum = 0.0
+        self.latencies: List[float] = []
+
+        # Per producer, every sequence below the low-water mark has been seen or
+        # given up on; only out-of-order arrivals within the window are kept.
+        self._low = [0] * producers
+        self._ahead: List[Set[int]] = [set() for _ in range(producers)]
+        self._lock = threading.Lock()
+
+    def record(self, item: Message, *args, **kwargs) -> None:
+        latency = (time.perf_counter_ns() - item[2]) / 1e6
+        producer_index, seq = item[0], item[1]
+
+        with self._lock:
+            self.consumed += 1
+            self.latency_sum += latency
+            self.latency_max = max(self.latency_max, latency)
+            if len(self.latencies) < self.reservoir_size:
+                self.latencies.append(latency)
+            else:
+                slot = random.randrange(self.consumed)
+                if slot < self.reservoir_size:
+                    self.latencies[slot] = latency
+
+            low, ahead = self._low[producer_index], self._ahead[producer_index]
+            if seq < low or seq in ahead:
+                self.duplicated += 1
+                return
+            self.unique += 1
+            # Give up on sequences that fell out of the window, so a lost message
+            # cannot make the pending set grow for the rest of the run.
+            while seq - low >= self.reorder_window:
+                if low in ahead:
+                    ahead.remove(low)
+                else:
+                    self.gaps += 1
+                low += 1
+            if seq == low:
+                low += 1
+            else:
+                ahead.add(seq)
+            while low in ahead:
+                ahead.remove(low)
+                low += 1
+            self._low[producer_index] = low
+
+    def latency_summary(self) -> Dict[Text, Optional[float]]:
+        with self._lock:
+            latencies = sorted(self.latencies)
+            mean = self.latency_sum / self.consumed if self.consumed else None
+            latency_max = self.latency_max if self.consumed else None
+        return {
+            "mean": mean,
+            "p50": percentile(latencies, 50),
+            "p90": percentile(latencies, 90),
+            "p99": percentile(latencies, 99),
+            "p999": percentile(latencies, 99.9),
+            "max": latency_max,
+        }
+
+
+def make_message_target(
+    index: int,
+    message_size: int,
+    interval_seconds: Number = 0.0,
+    stop_event: Optional[threading.Event] = None,
+) -> Callable[[], Message]:
+    sequence = itertools_count()
+    payload = os.urandom(message_size)
+    stop_event = stop_event or threading.Event()
+    time_start: List[float] = []
+
+    def target() -> Message:
+        seq = next(sequence)
+        if interval_seconds > 0:
+            # Pace against a fixed schedule so per-message overhead cannot drift
+            # the rate; a producer that falls behind catches up without sleeping.
+            if not time_start:
+                time_start.append(time.monotonic())
+            wait = time_start[0] + seq * interval_seconds - time.monotonic()
+            if wait > 0:
+                stop_event.wait(wait)
+        return (index, seq, time.perf_counter_ns(), payload)
+
+    return target
+
+
+def run_load_test(
+    broker: Text = "queue",
+    producers: int = 1,
+    consumers: int = 1,
+    message_size: int = 64,
+    rate: Number = 0,
+    duration: Number = 10.0,
+    maxsize: int = 0,
+    drain_timeout: Number = 5.0,
+    sample_interval: Number = 1.0,
+    reservoir_size: int = 100_000,
+    reorder_window: int = 100_000,
+) -> Dict[Text, Any]:
+    if broker not in BROKERS:
+        raise ValueError(f"Unknown broker '{broker}', expected one of {list(BROKERS)}")
+    if producers <= 0 or consumers <= 0:
+        raise ValueError("At least one producer and one consumer are required")
+    if broker == "spsc" and (producers != 1 or consumers != 1):
+        raise ValueError("The 'spsc' broker supports exactly one producer/consumer")
+
+    broker_kwargs = dict(maxsize=maxsize) if maxsize > 0 else {}
+    message_broker = BROKERS[broker](**broker_kwargs)
+    recorder = LoadRecorder(
+        producers, reservoir_size=reservoir_size, reorder_window=reorder_window
+    )
+    interval_seconds = producers / rate if rate > 0 else 0.0
+    stop_producing = threading.Event()
+
+    mq = SequentialMessageQueue(
+        name="LoadTest",
+        producers=[
+            Producer(
+                target=make_message_target(
+                    index,
+                    message_size,
+                    interval_seconds=interval_seconds,
+                    stop_event=stop_producing,
+                ),
+                name=f"load_producer_{index}",
+            )
+            for index in range(producers)
+        ],
+        consumers=[
+            Consumer(target=recorder.record, name=f"load_consumer_{index}")
+            for index in range(consumers)
+        ],
+        broker=message_broker,
+    )
+
+    rss_start = rss_bytes()
+    rss_peak = rss_start
+    time_start = time.monotonic()
+    runner = Thread(target=mq.run, name="mqflow-loadtest")
+    runner.start()
+
+    deadline = time_start + duration
+    while runner.is_alive() and time.monotonic() < deadline:
+        time.sleep(max(0.0, min(sample_interval, deadline - time.monotonic())))
+        rss_peak = max(rss_peak, rss_bytes())
+    elapsed = time.monotonic() - time_start
+
+    # Stop producing, give consumers a chance to drain, then stop everything.
+    stop_producing.set()
+    for producer in mq.producers:
+        producer.stop()
+    drain_deadline = time.monotonic() + drain_timeout
+    while time.monotonic() < drain_deadline and message_broker.qsize() > 0:
+        time.sleep(0.01)
+    mq.stop()
+    runner.join()
+    pending = message_broker.qsize()
+    rss_end = rss_bytes()
+    rss_peak = max(rss_peak, rss_end)
+
+    produced = sum(producer.count for producer in mq.producers)
+    return {
+        "config": {
+            "broker": broker,
+            "producers": producers,
+            "consumers": consumers,
+            "message_size": message_size,
+            "rate": rate,
+            "duration": duration,
+            "maxsize": maxsize,
+        },
+        "elapsed_seconds": elapsed,
+        "produced": produced,
+        "produce_rate": produced / elapsed if elapsed else 0.0,
+        "consumed": recorder.consumed,
+        "duplicated": recorder.duplicated,
+        "gaps": recorder.gaps,
+        "pending": pending,
+        "dropped": max(0, produced - recorder.unique - pending),
+        "throughput": recorder.consumed / elapsed if elapsed else 0.0,
+        "latency_ms": recorder.latency_summary(),
+        "rss_bytes": {
+            "start": rss_start,
+            "end": rss_end,
+            "peak": rss_peak,
+            "growth": rss_end - rss_start,
+        },
+    }
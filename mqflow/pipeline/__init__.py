@@ -1,8 +1,10 @@
+from .admin import AdminServer
 from .base import MessageQueueBase
 from .sequential import SequentialMessageQueue
 
 
 __all__ = [
+    "AdminServer",
     "MessageQueueBase",
     "SequentialMessageQueue",
 ]
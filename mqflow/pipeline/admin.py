@@ -0,0 +1,136 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any, Dict, Optional, Text, Tuple
+from urllib.parse import parse_qs, urlparse
+import json
+import logging
+import math
+import threading
+
+from mqflow.config import settings
+
+if TYPE_CHECKING:
+    from mqflow.pipeline.base import MessageQueueBase
+
+
+logger = logging.getLogger(settings.logger_name)
+
+
+class AdminServer:
+    def __init__(
+        self,
+        pipeline: "MessageQueueBase",
+        *args,
+        host: Text = "127.0.0.1",
+        port: int = 0,
+        **kwargs,
+    ):
+        self.pipeline = pipeline
+        self.host = host
+        self.port = port
+
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> Tuple[Text, int]:
+        if self._server is None:
+            return (self.host, self.port)
+        return self._server.server_address[:2]
+
+    def start(self) -> None:
+        self._server = ThreadingHTTPServer((self.host, self.port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="mqflow-admin", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Admin server listening on {self.address}")
+
+    def stop(self) -> None:
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+        self._thread = None
+
+    def handle(
+        self, method: Text, path: Text, params: Dict[Text, Text]
+    ) -> Tuple[int, Dict[Text, Any]]:
+        pipeline = self.pipeline
+
+        if method == "GET" and path in ("/", "/stats"):
+            return 200, pipeline.stats()
+
+        if method != "POST":
+            return 404, {"error": f"Unknown endpoint: {method} {path}"}
+
+        if path == "/pause":
+            for worker in self._select_workers(params):
+                worker.pause()
+        elif path == "/resume":
+            for worker in self._select_workers(params):
+                worker.resume()
+        elif path == "/stop":
+            pipeline.stop()
+        elif path == "/producers/interval":
+            seconds = float(params["seconds"])
+            if not math.isfinite(seconds) or seconds < 0:
+                raise ValueError("'seconds' must be a finite, non-negative number")
+            for producer in self._select_workers(params, default="producers"):
+                producer.interval_seconds = seconds
+        elif path == "/consumers/resize":
+            if not hasattr(pipeline, "resize_consumers"):
+                return 400, {"error": "The pipeline does not support resizing"}
+            pipeline.resize_consumers(int(params["count"]))
+        else:
+            return 404, {"error": f"Unknown endpoint: {method} {path}"}
+        return 200, pipeline.stats()
+
+    def _select_workers(self, params: Dict[Text, Text], default: Text = "all"):
+        group = params.get("group", default)
+        if group == "all":
+            workers = list(self.pipeline.producers) + list(self.pipeline.consumers)
+        elif group == "producers":
+            workers = list(self.pipeline.producers)
+        elif group == "consumers":
+            workers = list(self.pipeline.consumers)
+        else:
+            raise ValueError(f"Unknown group: {group}")
+
+        name = params.get("name")
+        return [w for w in workers if name is None or w.name == name]
+
+    def _handler(self):
+        admin = self
+
+        class AdminRequestHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                self._dispatch("GET")
+
+            def do_POST(self):
+                self._dispatch("POST")
+
+            def log_message(self, format, *args):
+                logger.debug(format % args)
+
+            def _dispatch(self, method: Text):
+                url = urlparse(self.path)
+                params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+                try:
+                    status, body = admin.handle(method, url.path, params)
+                except (KeyError, ValueError) as e:
+                    status, body = 400, {"error": f"Invalid request: {e!r}"}
+                except Exception as e:
+                    logger.exception(e)
+                    status, body = 500, {"error": repr(e)}
+
+                payload = json.dumps(body, default=str).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        return AdminRequestHandler
@@ -1,10 +1,23 @@
 from abc import ABC
-from typing import Generic, List, Optional, Type, TypeVar
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Text,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 from typing_extensions import ParamSpec
 import threading
+import time
 
 from mqflow.broker.base import BrokerBase
 from mqflow.consumer.base import ConsumerBase
+from mqflow.pipeline.admin import AdminServer
 from mqflow.producer.base import ProducerBase
 
 
@@ -17,21 +30,44 @@ class MessageQueueBase(ABC, Generic[P, S, T]):
     def __init__(
         self,
         *args,
+        name: Text = "MessageQueueBase",
         producers: Optional[List[Type["ProducerBase[T]"]]] = None,
         consumers: Optional[List[Type["ConsumerBase[P, S, T]"]]] = None,
         broker: Optional[Type["BrokerBase[T]"]] = None,
+        result_broker: Optional[Type["BrokerBase[S]"]] = None,
+        admin_address: Optional[Tuple[Text, int]] = None,
         **kwargs,
     ):
+        self.name = name
         self.producers = producers or []
         self.consumers = consumers or []
         self.broker = broker
+        self.result_broker = result_broker
+        self.admin_address = admin_address
+        self.admin_server: Optional["AdminServer"] = None
 
         self._stop_event = threading.Event()
+        self._threads: Dict[int, threading.Thread] = {}
+        self._started_at: Dict[int, float] = {}
 
     def run(self, *args, **kwargs):
         raise NotImplementedError
 
+    def gather(self, *args, **kwargs) -> List[S]:
+        raise NotImplementedError
+
+    def start_admin(self) -> None:
+        if self.admin_address is None or self.admin_server is not None:
+            return
+        host, port = self.admin_address
+        admin_server = AdminServer(self, host=host, port=port)
+        admin_server.start()
+        self.admin_server = admin_server
+
     def finish(self, *args, **kwargs):
+        if self.admin_server is not None:
+            self.admin_server.stop()
+            self.admin_server = None
         self.broker.close()
 
     def stop(self) -> None:
@@ -43,3 +79,61 @@ class MessageQueueBase(ABC, Generic[P, S, T]):
 
     def is_stop(self) -> bool:
         return self._stop_event.is_set()
+
+    def pause(self) -> None:
+        for producer in self.producers:
+            producer.pause()
+        for consumer in self.consumers:
+            consumer.pause()
+
+    def resume(self) -> None:
+        for producer in self.producers:
+            producer.resume()
+        for consumer in self.consumers:
+            consumer.resume()
+
+    def stats(self) -> Dict[Text, Any]:
+        try:
+            qsize = self.broker.qsize() if self.broker is not None else None
+        except NotImplementedError:
+            qsize = None
+
+        return {
+            "name": self.name,
+            "stopped": self.is_stop(),
+            "broker": {
+                "name": getattr(self.broker, "name", None),
+                "qsize": qsize,
+                "maxsize": getattr(self.broker, "maxsize", None),
+            },
+            "producers": [self._worker_stats(producer) for producer in self.producers],
+            "consumers": [self._worker_stats(consumer) for consumer in self.consumers],
+        }
+
+    def _start_worker(
+        self,
+        worker: Union["ProducerBase[T]", "ConsumerBase[P, S, T]"],
+        thread: threading.Thread,
+    ) -> None:
+        self._threads[id(worker)] = thread
+        self._started_at[id(worker)] = time.monotonic()
+        thread.start()
+
+    def _worker_stats(
+        self, worker: Union["ProducerBase[T]", "ConsumerBase[P, S, T]"]
+    ) -> Dict[Text, Any]:
+        thread = self._threads.get(id(worker))
+        started_at = self._started_at.get(id(worker))
+        elapsed = None if started_at is None else time.monotonic() - started_at
+
+        stats = {
+            "name": worker.name,
+            "count": worker.count,
+            "rate": worker.count / elapsed if elapsed else 0.0,
+            "alive": thread is not None and thread.is_alive(),
+            "paused": worker.is_paused(),
+            "stopped": worker.is_stop(),
+        }
+        if isinstance(worker, ProducerBase):
+            stats["interval_seconds"] = worker.interval_seconds
+        return stats
@@ -1,10 +1,13 @@
 from threading import Thread
-from typing import List, Optional, TYPE_CHECKING, Text, Type, TypeVar
+from typing import List, Optional, TYPE_CHECKING, Text, Tuple, Type, TypeVar
 from typing_extensions import ParamSpec
 import logging
+import threading
 
+from mqflow.broker.base import QueueBroker
 from mqflow.pipeline.base import MessageQueueBase
 from mqflow.config import settings
+from mqflow.exceptions import EmptyError
 
 if TYPE_CHECKING:
     from mqflow.broker.base import BrokerBase
@@ -27,54 +30,167 @@ class SequentialMessageQueue(MessageQueueBase[P, S, T]):
         producers: Optional[List[Type["ProducerBase[T]"]]] = None,
         consumers: Optional[List[Type["ConsumerBase[P, S, T]"]]] = None,
         broker: Optional[Type["BrokerBase[T]"]] = None,
+        result_broker: Optional[Type["BrokerBase[S]"]] = None,
+        admin_address: Optional[Tuple[Text, int]] = None,
         **kwargs,
     ):
         super().__init__(
-            *args, producers=producers, consumers=consumers, broker=broker, **kwargs
+            *args,
+            name=name,
+            producers=producers,
+            consumers=consumers,
+            broker=broker,
+            result_broker=result_broker,
+            admin_address=admin_address,
+            **kwargs,
         )
 
-    def run(self, *args, **kwargs):
+        self._result_broker: Optional[Type["BrokerBase[S]"]] = None
+        self._producer_threads: List[Thread] = []
+        self._consumer_threads: Optional[List[Thread]] = None
+        self._consumers_lock = threading.RLock()
+
+    def run(
+        self,
+        *args,
+        result_broker: Optional[Type["BrokerBase[S]"]] = None,
+        **kwargs,
+    ):
         if not self.producers or not self.consumers or self.broker is None:
             raise ValueError("No producers, consumers, or broker defined")
 
-        producer_threads = [
-            Thread(target=producer.publish, kwargs=dict(broker=self.broker))
-            for producer in self.producers
-        ]
-        consumer_threads = [
-            Thread(target=consumer.listen, kwargs=dict(broker=self.broker))
-            for consumer in self.consumers
-        ]
+        self._result_broker = (
+            self.result_broker if result_broker is None else result_broker
+        )
+        self._producer_threads = []
+        self._consumer_threads = []
 
-        for thread in producer_threads:
-            thread.start()
-        for thread in consumer_threads:
-            thread.start()
+        self.start_admin()
+        for producer in self.producers:
+            thread = Thread(target=producer.publish, kwargs=dict(broker=self.broker))
+            self._producer_threads.append(thread)
+            self._start_worker(producer, thread)
+        with self._consumers_lock:
+            for consumer in self.consumers:
+                self._start_consumer(consumer)
 
         try:
-            for thread in producer_threads:
-                thread.join()
-            for thread in consumer_threads:
-                thread.join()
+            self._join_threads()
 
         except KeyboardInterrupt:
             logger.info("KeyboardInterrupt")
             [producer.stop() for producer in self.producers]
             [consumer.stop() for consumer in self.consumers]
-            for thread in producer_threads:
-                thread.join()
-            for thread in consumer_threads:
-                thread.join()
+            self._join_threads()
 
         except Exception as e:
             logger.exception(e)
             logger.info(f"Raise exception stop: {e}")
             [producer.stop() for producer in self.producers]
             [consumer.stop() for consumer in self.consumers]
-            for thread in producer_threads:
-                thread.join()
-            for thread in consumer_threads:
-                thread.join()
+            self._join_threads()
 
         finally:
             self.finish()
+
+    def add_consumer(self, consumer: "ConsumerBase[P, S, T]") -> None:
+        with self._consumers_lock:
+            if consumer not in self.consumers:
+                self.consumers.append(consumer)
+            if self._consumer_threads is not None and not self.is_stop():
+                self._start_consumer(consumer)
+
+    def resize_consumers(self, count: int) -> None:
+        if count < 0:
+            raise ValueError("The consumer count must not be negative")
+
+        # Hold the lock throughout so concurrent resizes cannot overshoot.
+        with self._consumers_lock:
+            template = self.consumers[-1] if self.consumers else None
+            self._prune_consumers()
+
+            active = [consumer for consumer in self.consumers if not consumer.is_stop()]
+            if count < len(active):
+                for consumer in active[count:]:
+                    consumer.stop()
+                return
+
+            if active:
+                template = active[-1]
+            if template is None:
+                raise ValueError("No consumer defined to scale up from")
+            for index in range(len(active), count):
+                self.add_consumer(template.clone(name=f"{template.name}-{index}"))
+
+    def gather(self, *args, **kwargs) -> List[S]:
+        result_broker = self.result_broker
+        if result_broker is None:
+            result_broker = QueueBroker()
+        if not self.producers or not self.consumers or self.broker is None:
+            raise ValueError("No producers, consumers, or broker defined")
+
+        # Drain while the pipeline runs so a bounded result broker never blocks it.
+        errors: List[BaseException] = []
+
+        def run():
+            try:
+                self.run(*args, result_broker=result_broker, **kwargs)
+            except BaseException as e:
+                errors.append(e)
+
+        runner = Thread(target=run)
+        runner.start()
+
+        results: List[S] = []
+        try:
+            while runner.is_alive():
+                try:
+                    results.append(result_broker.get(block=True, timeout=0.1))
+                except EmptyError:
+                    continue
+        except KeyboardInterrupt:
+            logger.info("KeyboardInterrupt")
+            self.stop()
+        runner.join()
+        results.extend(result_broker)
+
+        if errors:
+            raise errors[0]
+        return results
+
+    def _start_consumer(self, consumer: "ConsumerBase[P, S, T]") -> None:
+        thread = Thread(
+            target=consumer.listen,
+            kwargs=dict(broker=self.broker, result_broker=self._result_broker),
+        )
+        self._consumer_threads.append(thread)
+        self._start_worker(consumer, thread)
+
+    def _prune_consumers(self) -> None:
+        # Forget consumers that were stopped and whose thread has exited,
+        # so repeated resizing does not grow `consumers` and the stats.
+        for consumer in list(self.consumers):
+            thread = self._threads.get(id(consumer))
+            if thread is None or thread.is_alive() or not consumer.is_stop():
+                continue
+            self.consumers.remove(consumer)
+            self._threads.pop(id(consumer), None)
+            self._started_at.pop(id(consumer), None)
+            if self._consumer_threads is not None and thread in self._consumer_threads:
+                self._consumer_threads.remove(thread)
+
+    def _join_threads(self) -> None:
+        for thread in self._producer_threads:
+            thread.join()
+        # Consumers may be added or pruned while running, so keep joining the
+        # first remaining thread until none are left.
+        while True:
+            with self._consumers_lock:
+                if not self._consumer_threads:
+                    self._consumer_threads = None
+                    return
+                thread = self._consumer_threads[0]
+            thread.join()
+            with self._consumers_lock:
+                if thread in self._consumer_threads:
+                    self._consumer_threads.remove(thread)
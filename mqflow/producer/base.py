@@ -14,6 +14,7 @@ from typing import (
     TypeVar,
 )
 from typing_extensions import ParamSpec
+import copy
 import logging
 import threading
 import time
@@ -55,6 +56,8 @@ class ProducerBase(ABC, Generic[T]):
 
         self._count: int = 0
         self._stop_event = threading.Event()
+        self._resume_event = threading.Event()
+        self._resume_event.set()
 
     def publish(
         self,
@@ -69,16 +72,23 @@ class ProducerBase(ABC, Generic[T]):
         self._sleep_with_stop_event(self.timer_seconds)
 
         count = 0
-        while self.is_stop() is False and (
-            self.max_count is None or count < self.max_count
-        ):
-            result = self.produce(**kwargs)
-            broker.put(result, block=self.block, timeout=self.timeout)
+        try:
+            while self.is_stop() is False and (
+                self.max_count is None or count < self.max_count
+            ):
+                self._resume_event.wait()
+                if self.is_stop():
+                    break
 
-            count += 1
-            self.count_add_one()
+                result = self.produce(**kwargs)
+                broker.put(result, block=self.block, timeout=self.timeout)
 
-            self._sleep_with_stop_event(self.interval_seconds)
+                count += 1
+                self.count_add_one()
+
+                self._sleep_with_stop_event(self.interval_seconds)
+        finally:
+            broker.release_producer()
 
     def produce(self, **kwargs) -> T:
         raise NotImplementedError
@@ -92,17 +102,38 @@ class ProducerBase(ABC, Generic[T]):
 
     def stop(self) -> None:
         self._stop_event.set()
+        self._resume_event.set()
 
     def is_stop(self) -> bool:
         return self._stop_event.is_set()
 
+    def pause(self) -> None:
+        if not self.is_stop():
+            self._resume_event.clear()
+
+    def resume(self) -> None:
+        self._resume_event.set()
+
+    def is_paused(self) -> bool:
+        return not self._resume_event.is_set()
+
+    def clone(self, name: Optional[Text] = None):
+        worker = copy.copy(self)
+        worker.name = self.name if name is None else name
+        worker._count = 0
+        worker._stop_event = threading.Event()
+        worker._resume_event = threading.Event()
+        worker._resume_event.set()
+        return worker
+
     def _sleep_with_stop_event(self, seconds: Number) -> None:
-        _sleep_sec, _sleep_ns = modf(seconds)
+        # `modf` returns the fractional part first, then the integral part.
+        _sleep_frac, _sleep_sec = modf(seconds)
         for _ in range(int(_sleep_sec)):
             if self.is_stop():
                 return
             time.sleep(1)
-        time.sleep(_sleep_ns)
+        time.sleep(_sleep_frac)
 
 
 class Producer(ProducerBase[T]):
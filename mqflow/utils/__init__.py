@@ -0,0 +1,6 @@
+from .cache import TTLCache
+
+
+__all__ = [
+    "TTLCache",
+]
@@ -0,0 +1,126 @@
+from collections import deque
+from numbers import Number
+from typing import Callable, Deque, Hashable, Optional, Set, Text
+import math
+import threading
+import time
+
+
+class _Generation:
+    __slots__ = ("opened_at", "touched_at", "keys")
+
+    def __init__(self, now: float):
+        self.opened_at = now
+        self.touched_at = now
+        self.keys: Set[Hashable] = set()
+
+
+class TTLCache:
+    # Keys live in a few generations of plain sets rather than one ordered
+    # mapping with a per-key expiry: about 35 bytes per key plus the key object
+    # itself, instead of ~115. Expiry and eviction drop a whole generation at a
+    # time, so a key lives between `ttl` and `ttl * (1 + 1 / generations)`, and
+    # at least `maxsize * (1 - 1 / generations)` of the newest keys are kept.
+    def __init__(
+        self,
+        maxsize: int = 1_000_000,
+        ttl: Optional[Number] = None,
+        timer: Callable[[], float] = time.monotonic,
+        generations: int = 8,
+    ):
+        if maxsize <= 0:
+            raise ValueError("The maxsize must be a positive integer")
+        if generations <= 0:
+            raise ValueError("The generations must be a positive integer")
+
+        self.maxsize = int(maxsize)
+        self.ttl = ttl
+        self.timer = timer
+        self.generations = min(int(generations), self.maxsize)
+        self.hits = 0
+        self.misses = 0
+
+        self._capacity = math.ceil(self.maxsize / self.generations)
+        self._span = None if ttl is None else ttl / self.generations
+        self._data: Deque[_Generation] = deque()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> Text:
+        return (
+            f"{self.__class__.__name__}(maxsize={self.maxsize}, ttl={self.ttl}, "
+            + f"size={len(self)}, hits={self.hits}, misses={self.misses})"
+        )
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            self._expire(self.timer())
+            return any(key in generation.keys for generation in self._data)
+
+    def add(self, key: Hashable) -> bool:
+        with self._lock:
+            now = self.timer()
+            self._expire(now)
+
+            data = self._data
+            if data and key in data[-1].keys:
+                self.hits += 1
+                data[-1].touched_at = now
+                return False
+
+            new = not self._remove(key)
+            if new:
+                self.misses += 1
+            else:
+                # Refresh the key by moving it into the current generation.
+                self.hits += 1
+
+            current = self._current(now)
+            current.keys.add(key)
+            current.touched_at = now
+            self._size += 1
+            while self._size > self.maxsize:
+                self._size -= len(data.popleft().keys)
+            return new
+
+    def discard(self, key: Hashable) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._size = 0
+            self.hits = 0
+            self.misses = 0
+
+    def _remove(self, key: Hashable) -> bool:
+        for generation in self._data:
+            if key in generation.keys:
+                generation.keys.remove(key)
+                self._size -= 1
+                if not generation.keys:
+                    self._data.remove(generation)
+                return True
+        return False
+
+    def _current(self, now: float) -> _Generation:
+        data = self._data
+        if (
+            not data
+            or len(data[-1].keys) >= self._capacity
+            or (self._span is not None and now - data[-1].opened_at >= self._span)
+        ):
+            data.append(_Generation(now))
+        return data[-1]
+
+    def _expire(self, now: float) -> None:
+        # Generations are kept in insertion order, so expired ones are in front.
+        if self.ttl is None:
+            return
+        data = self._data
+        while data and data[0].touched_at + self.ttl <= now:
+            self._size -= len(data.popleft().keys)
@@ -1,7 +1,11 @@
+from multiprocessing import Process
 from multiprocessing.queues import Queue
 from queue import Queue
+from threading import Thread
+import time
 
 from mqflow.broker import MPQueueBroker, QueueBroker
+from mqflow.consumer import Consumer
 from mqflow.exceptions import EmptyError, FullError
 
 
@@ -70,3 +74,80 @@ def test_mp_queue_broker():
             assert False
         except EmptyError:
             pass
+
+
+def test_mp_queue_broker_prefetch():
+    with MPQueueBroker(prefetch=4) as broker:
+        for i in range(6):
+            broker.put(i)
+        time.sleep(0.1)
+
+        assert broker.get() == 0
+        assert len(broker._buffer) == 3
+        assert broker.qsize() == 5
+        assert broker.get() == 1
+        broker.task_done()
+        broker.task_done()
+
+        broker.requeue()
+        assert len(broker._buffer) == 0
+        time.sleep(0.1)
+        assert sorted(broker.get(timeout=1) for _ in range(4)) == [2, 3, 4, 5]
+        for _ in range(4):
+            broker.task_done()
+        broker.join()
+
+
+def consume_one(broker: "MPQueueBroker"):
+    Consumer(target=lambda *args: None, max_count=1).listen(broker=broker)
+
+
+def test_mp_queue_broker_prefetch_requeue_on_stop():
+    with MPQueueBroker(prefetch=4) as broker:
+        for i in range(4):
+            broker.put(i)
+        time.sleep(0.1)
+
+        process = Process(target=consume_one, args=(broker,))
+        process.start()
+        process.join()
+
+        items = []
+        consumer = Consumer(
+            target=lambda item, *args: items.append(item), max_count=3, timeout=5
+        )
+        consumer.listen(broker=broker)
+        broker.join()
+
+        assert sorted(items) == [1, 2, 3]
+        assert broker.qsize() == 0
+
+
+def test_mp_queue_broker_prefetch_bounded():
+    with MPQueueBroker(maxsize=4, prefetch=4) as broker:
+        for i in range(4):
+            broker.put(i)
+        time.sleep(0.1)
+
+        assert broker.get() == 0
+        assert len(broker._buffer) == 3
+        # Prefetched items keep their slots, so only the consumed one is free.
+        broker.put(4)
+        assert broker.full() is True
+        assert broker.qsize() == 4
+        try:
+            broker.put(5, timeout=0.01)
+            assert False
+        except FullError:
+            pass
+
+        requeue = Thread(target=broker.requeue, daemon=True)
+        requeue.start()
+        requeue.join(timeout=3)
+        assert requeue.is_alive() is False
+
+        time.sleep(0.1)
+        assert sorted(broker.get(timeout=1) for _ in range(4)) == [1, 2, 3, 4]
+        for _ in range(5):
+            broker.task_done()
+        broker.join()
@@ -0,0 +1,53 @@
+from mqflow.broker import DedupBroker, QueueBroker
+from mqflow.consumer import Consumer
+from mqflow.exceptions import EmptyError
+
+
+def test_dedup_broker():
+    broker = DedupBroker(QueueBroker())
+    for item in (1, 2, 1, 3, 2, 1):
+        broker.put(item)
+
+    assert list(broker) == [1, 2, 3]
+    assert broker.hits == 3
+    assert broker.misses == 3
+
+    try:
+        broker.get(timeout=0.01)
+        assert False
+    except EmptyError:
+        pass
+
+
+def test_dedup_broker_key_and_join():
+    broker = DedupBroker(QueueBroker(), key=lambda item: item["id"])
+    for item in ({"id": 1}, {"id": 1}, {"id": 2}):
+        broker.put(item)
+
+    items = []
+    consumer = Consumer(target=lambda item, *args: items.append(item), max_count=2)
+    consumer.listen(broker=broker)
+    broker.join()
+
+    assert items == [{"id": 1}, {"id": 2}]
+    assert broker.qsize() == 0
+
+
+def test_dedup_broker_unhashable():
+    broker = DedupBroker(QueueBroker())
+    try:
+        broker.put({"id": 1})
+        assert False
+    except TypeError as e:
+        assert "key" in str(e)
+    assert broker.qsize() == 0
+
+    # A key that fails on a message already taken from the broker still acks it.
+    broker = DedupBroker(QueueBroker(), key=lambda item: item["id"])
+    broker.put({"id": [1]})
+    try:
+        broker.get_nowait()
+        assert False
+    except TypeError:
+        pass
+    assert broker.broker.queue.unfinished_tasks == 0
@@ -0,0 +1,51 @@
+import time
+
+from mqflow.broker import DelayBroker
+from mqflow.exceptions import EmptyError, FullError
+
+
+def test_delay_broker():
+    broker = DelayBroker()
+    broker.put("late", delay=0.2)
+    broker.put("later", deliver_at=time.time() + 0.3)
+    broker.put("now")
+
+    assert broker.qsize() == 3
+    assert broker.get_nowait() == "now"
+    try:
+        broker.get_nowait()
+        assert False
+    except EmptyError:
+        pass
+
+    time_start = time.monotonic()
+    assert broker.get(timeout=1) == "late"
+    assert broker.get(timeout=1) == "later"
+    assert 0.2 <= time.monotonic() - time_start < 1
+
+    for _ in range(3):
+        broker.task_done()
+    broker.join()
+
+
+def test_delay_broker_exceptions():
+    broker = DelayBroker(maxsize=1)
+    broker.put(1, delay=10)
+
+    try:
+        broker.put_nowait(2)
+        assert False
+    except FullError:
+        pass
+
+    try:
+        broker.get(timeout=0.01)
+        assert False
+    except EmptyError:
+        pass
+
+    try:
+        broker.put(2, timeout=0.01, delay=1, deliver_at=time.time())
+        assert False
+    except ValueError:
+        pass
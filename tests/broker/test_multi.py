@@ -0,0 +1,68 @@
+from threading import Thread
+import time
+
+from mqflow.broker import DelayBroker, MultiBroker, QueueBroker
+from mqflow.exceptions import EmptyError
+
+
+def test_multi_broker_weights():
+    heavy, light = QueueBroker(name="heavy"), QueueBroker(name="light")
+    for _ in range(30):
+        heavy.put("heavy")
+        light.put("light")
+
+    with MultiBroker([heavy, light], weights=[2, 1]) as broker:
+        items = [broker.get_nowait() for _ in range(30)]
+        for _ in items:
+            broker.task_done()
+        heavy.put("heavy")
+
+    assert items.count("heavy") == 20
+    assert items.count("light") == 10
+    assert heavy._ready_callbacks == [] and light._ready_callbacks == []
+
+
+def test_multi_broker_wakeup():
+    brokers = [QueueBroker(), DelayBroker()]
+    broker = MultiBroker(brokers)
+
+    try:
+        broker.get(timeout=0.01)
+        assert False
+    except EmptyError:
+        pass
+
+    brokers[1].put("delayed", delay=0.1)
+    Thread(target=lambda: (time.sleep(0.05), brokers[0].put("ready"))).start()
+
+    time_start = time.monotonic()
+    assert broker.get(timeout=1) == "ready"
+    assert broker.get(timeout=1) == "delayed"
+    assert time.monotonic() - time_start < 0.5
+
+    broker.task_done()
+    broker.task_done()
+    broker.join()
+    broker.detach()
+
+
+def test_multi_broker_fairness_with_delayed_broker():
+    ready, delayed = QueueBroker(name="ready"), DelayBroker(name="delayed")
+    for _ in range(200):
+        ready.put("ready")
+    deliver_at = time.time() + 0.5
+    for _ in range(50):
+        delayed.put("delayed", deliver_at=deliver_at)
+
+    with MultiBroker([ready, delayed]) as broker:
+        # The delayed broker is non-empty but has nothing ready yet.
+        items = [broker.get_nowait() for _ in range(100)]
+        assert items.count("ready") == 100
+
+        time.sleep(max(0.0, deliver_at - time.time()) + 0.05)
+        items = [broker.get_nowait() for _ in range(20)]
+        for _ in range(120):
+            broker.task_done()
+
+    assert items.count("ready") == 10
+    assert items.count("delayed") == 10
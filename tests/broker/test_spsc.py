@@ -0,0 +1,87 @@
+from threading import Thread
+
+from mqflow.broker import SPSCBroker
+from mqflow.consumer import Consumer
+from mqflow.producer import Producer
+from mqflow.exceptions import EmptyError, FullError
+
+
+def test_spsc_broker():
+    count = 10_000
+    broker = SPSCBroker(maxsize=8)
+    results = []
+
+    def consume():
+        for _ in range(count):
+            results.append(broker.get())
+            broker.task_done()
+
+    consumer = Thread(target=consume)
+    consumer.start()
+    for i in range(count):
+        broker.put(i)
+    broker.join()
+    consumer.join()
+
+    assert results == list(range(count))
+    assert broker.empty()
+
+
+def test_spsc_broker_exceptions():
+    broker = SPSCBroker(maxsize=1)
+
+    try:
+        broker.get(timeout=0.01)
+        assert False
+    except EmptyError:
+        pass
+
+    try:
+        broker.put_nowait(1)
+        broker.put(2, timeout=0.01)
+        assert False
+    except FullError:
+        pass
+
+    errors = []
+
+    def second_producer():
+        try:
+            broker.put_nowait(3)
+        except RuntimeError as e:
+            errors.append(e)
+
+    thread = Thread(target=second_producer)
+    thread.start()
+    thread.join()
+    assert len(errors) == 1
+
+    try:
+        SPSCBroker(maxsize=0)
+        assert False
+    except ValueError:
+        pass
+
+
+def test_spsc_broker_release():
+    broker = SPSCBroker(maxsize=4)
+    producer = Producer(target=lambda: 1, max_count=2)
+    consumer = Consumer(target=lambda *args: None, max_count=1)
+
+    thread = Thread(target=producer.publish, kwargs=dict(broker=broker))
+    thread.start()
+    thread.join()
+    thread = Thread(target=consumer.listen, kwargs=dict(broker=broker))
+    thread.start()
+    thread.join()
+
+    # Both roles were released when publish/listen returned.
+    broker.put(2)
+    assert [broker.get(), broker.get()] == [1, 2]
+
+    # The main thread still holds both roles until they are reset.
+    broker.reset()
+    thread = Thread(target=broker.put_nowait, args=(3,))
+    thread.start()
+    thread.join()
+    assert broker.get_nowait() == 3
@@ -24,3 +24,47 @@ def test_consumer_exceptions():
         assert False
     except EmptyError:
         pass
+
+
+def test_consumer_result_broker():
+    max_count = 3
+    broker = QueueBroker()
+    result_broker = QueueBroker()
+    for i in range(max_count):
+        broker.put(i)
+    consumer = Consumer(
+        target=(lambda item, *args, **kwargs: item * 2),
+        max_count=max_count,
+        result_broker=result_broker,
+    )
+    consumer.listen(broker=broker)
+    assert list(result_broker) == [0, 2, 4]
+
+
+def test_consumer_multi_broker():
+    brokers = [QueueBroker(), QueueBroker()]
+    for i, broker in enumerate(brokers):
+        broker.put(i)
+    items = []
+    consumer = Consumer(target=lambda item, *args: items.append(item), max_count=2)
+    consumer.listen(broker=brokers, weights=[1, 3])
+    assert sorted(items) == [0, 1]
+
+
+def test_consumer_listen_max_count_and_errors():
+    broker = QueueBroker()
+    for i in range(3):
+        broker.put(i)
+
+    consumer = Consumer(target=lambda item, *args: item)
+    consumer.listen(broker=broker, max_count=2)
+    assert consumer.count == 2
+
+    consumer = Consumer(target=lambda item, *args: 1 / 0)
+    try:
+        consumer.listen(broker=broker)
+        assert False
+    except ZeroDivisionError:
+        pass
+    assert consumer.is_stop() is True
+    assert broker.queue.unfinished_tasks == 0
@@ -0,0 +1,62 @@
+from threading import Thread
+
+import pytest
+
+from mqflow.broker import QueueBroker
+from mqflow.consumer import VectorizedConsumer
+
+
+np = pytest.importorskip("numpy")
+
+
+def test_vectorized_consumer():
+    max_count = 10
+    broker = QueueBroker()
+    result_broker = QueueBroker()
+    for i in range(max_count):
+        broker.put([i, i])
+
+    batch_sizes = []
+
+    def kernel(batch, *args, **kwargs):
+        batch_sizes.append(len(batch))
+        return batch.sum(axis=1)
+
+    consumer = VectorizedConsumer(
+        target=kernel,
+        max_count=max_count,
+        max_batch_size=4,
+        result_broker=result_broker,
+    )
+    consumer.listen(broker=broker)
+    broker.join()
+
+    assert consumer.count == max_count
+    assert batch_sizes == [4, 4, 2]
+    assert [int(result) for result in result_broker] == [2 * i for i in range(10)]
+
+
+def test_vectorized_consumer_acknowledges_failed_batch():
+    broker = QueueBroker()
+    result_broker = QueueBroker()
+    for i in range(3):
+        broker.put([i, i])
+
+    def kernel(batch, *args, **kwargs):
+        return batch.sum(axis=1)[:1]
+
+    consumer = VectorizedConsumer(
+        target=kernel, max_batch_size=4, result_broker=result_broker
+    )
+    try:
+        consumer.listen(broker=broker)
+        assert False
+    except ValueError:
+        pass
+
+    joiner = Thread(target=broker.join, daemon=True)
+    joiner.start()
+    joiner.join(timeout=5)
+
+    assert joiner.is_alive() is False
+    assert consumer.is_stop() is True
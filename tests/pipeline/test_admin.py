@@ -0,0 +1,84 @@
+from threading import Thread
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+import json
+import time
+
+from mqflow.broker import QueueBroker
+from mqflow.consumer import Consumer
+from mqflow.pipeline import SequentialMessageQueue
+from mqflow.producer import Producer
+
+
+def request(mq: "SequentialMessageQueue", path: str, method: str = "GET"):
+    host, port = mq.admin_server.address
+    req = Request(f"http://{host}:{port}{path}", method=method)
+    with urlopen(req, timeout=5) as response:
+        return json.loads(response.read())
+
+
+def test_admin_server():
+    producer = Producer(
+        name="test_producer", target=(lambda: True), interval_seconds=0.01
+    )
+    consumer = Consumer(name="test_consumer", target=(lambda *args: None))
+    mq = SequentialMessageQueue(
+        producers=[producer],
+        consumers=[consumer],
+        broker=QueueBroker(),
+        admin_address=("127.0.0.1", 0),
+    )
+    runner = Thread(target=mq.run)
+    runner.start()
+    while mq.admin_server is None:
+        time.sleep(0.01)
+
+    try:
+        stats = request(mq, "/stats")
+        assert stats["producers"][0]["name"] == "test_producer"
+        assert stats["consumers"][0]["alive"] is True
+
+        stats = request(mq, "/pause?group=producers", method="POST")
+        assert stats["producers"][0]["paused"] is True
+        assert stats["consumers"][0]["paused"] is False
+        request(mq, "/resume", method="POST")
+
+        stats = request(mq, "/producers/interval?seconds=0.2", method="POST")
+        assert stats["producers"][0]["interval_seconds"] == 0.2
+        time.sleep(0.05)
+        count = producer.count
+        time.sleep(0.5)
+        assert producer.count - count <= 4
+        request(mq, "/producers/interval?seconds=0.01", method="POST")
+        for seconds in ("nan", "inf", "-1"):
+            try:
+                request(mq, f"/producers/interval?seconds={seconds}", method="POST")
+                assert False
+            except HTTPError as e:
+                assert e.code == 400
+        assert producer.interval_seconds == 0.01
+
+        stats = request(mq, "/consumers/resize?count=3", method="POST")
+        assert len(stats["consumers"]) == 3
+        assert all(consumer["alive"] for consumer in stats["consumers"])
+
+        stats = request(mq, "/consumers/resize?count=1", method="POST")
+        assert [consumer["stopped"] for consumer in stats["consumers"]] == [
+            False,
+            True,
+            True,
+        ]
+
+        # Stopped consumers are pruned once their threads have exited.
+        for thread in list(mq._consumer_threads[1:]):
+            thread.join(timeout=5)
+        stats = request(mq, "/consumers/resize?count=2", method="POST")
+        assert len(stats["consumers"]) == 2
+        assert all(consumer["alive"] for consumer in stats["consumers"])
+        assert len(mq._threads) == 3
+    finally:
+        mq.stop()
+        runner.join()
+
+    assert mq.admin_server is None
+    assert producer.count > 0
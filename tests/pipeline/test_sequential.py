@@ -1,4 +1,4 @@
-from threading import Thread
+from threading import Barrier, Thread
 import time
 
 from mqflow.broker import QueueBroker
@@ -38,3 +38,68 @@ def test_sequential_message_queue_stop():
     stop_signal.start()
 
     mq.run()
+
+
+def test_sequential_message_queue_gather():
+    max_count = 5
+    producer = Producer(
+        name="test_producer", target=(lambda *args, **kwargs: 1), max_count=max_count
+    )
+    consumers = [
+        Consumer(
+            name=f"test_consumer_{i}",
+            target=(lambda item, *args, **kwargs: item + 1),
+            max_count=max_count // 2 + i,
+        )
+        for i in range(2)
+    ]
+    mq = SequentialMessageQueue(
+        producers=[producer], consumers=consumers, broker=QueueBroker()
+    )
+    assert mq.gather() == [2] * max_count
+
+
+def test_sequential_message_queue_gather_bounded_result_broker():
+    max_count = 20
+    producer = Producer(
+        name="test_producer", target=(lambda *args, **kwargs: 1), max_count=max_count
+    )
+    consumer = Consumer(
+        name="test_consumer",
+        target=(lambda item, *args, **kwargs: item),
+        max_count=max_count,
+    )
+    mq = SequentialMessageQueue(
+        producers=[producer],
+        consumers=[consumer],
+        broker=QueueBroker(),
+        result_broker=QueueBroker(maxsize=2),
+    )
+    assert mq.gather() == [1] * max_count
+
+
+def test_sequential_message_queue_concurrent_resize():
+    producer = Producer(target=(lambda: 1), interval_seconds=0.01)
+    consumer = Consumer(name="test_consumer", target=(lambda *args: None))
+    mq = SequentialMessageQueue(
+        producers=[producer], consumers=[consumer], broker=QueueBroker()
+    )
+    runner = Thread(target=mq.run)
+    runner.start()
+    while mq._consumer_threads is None:
+        time.sleep(0.01)
+
+    barrier = Barrier(8)
+
+    def resize():
+        barrier.wait()
+        mq.resize_consumers(5)
+
+    try:
+        threads = [Thread(target=resize) for _ in range(8)]
+        [thread.start() for thread in threads]
+        [thread.join() for thread in threads]
+        assert len([c for c in mq.consumers if not c.is_stop()]) == 5
+    finally:
+        mq.stop()
+        runner.join()
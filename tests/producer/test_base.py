@@ -1,3 +1,5 @@
+import time
+
 from mqflow.broker import QueueBroker
 from mqflow.producer import Producer
 from mqflow.exceptions import FullError
@@ -27,3 +29,15 @@ def test_producer_exceptions():
     except FullError:
         assert producer.count == max_count
         assert broker.get() == sum(sum_args)
+
+
+def test_producer_interval():
+    max_count = 5
+    broker = QueueBroker()
+    producer = Producer(target=lambda: True, max_count=max_count, interval_seconds=0.05)
+
+    time_start = time.monotonic()
+    producer.publish(broker)
+
+    assert producer.count == max_count
+    assert time.monotonic() - time_start >= 0.2
@@ -0,0 +1,53 @@
+import json
+
+from mqflow.cli import main
+from mqflow.loadtest import LoadRecorder, run_load_test
+
+
+def test_load_recorder():
+    recorder = LoadRecorder(producers=2, reservoir_size=2)
+    for item in ((0, 0, 0, b""), (0, 9, 0, b""), (1, 0, 0, b""), (0, 9, 0, b"")):
+        recorder.record(item)
+
+    assert (recorder.consumed, recorder.unique, recorder.duplicated) == (4, 3, 1)
+    assert len(recorder.latencies) == 2
+
+    # Filling the gap advances the low-water mark and empties the pending set.
+    for seq in (3, 1, 2, 5, 4, 6, 7, 8, 1, 3):
+        recorder.record((0, seq, 0, b""))
+
+    assert (recorder.unique, recorder.duplicated) == (11, 3)
+    assert recorder._low == [10, 1]
+    assert recorder._ahead == [set(), set()]
+
+
+def test_load_recorder_permanent_gap():
+    recorder = LoadRecorder(producers=1, reorder_window=1000)
+    for seq in range(1, 200_000):
+        recorder.record((0, seq, 0, b""))
+
+    assert (recorder.unique, recorder.duplicated, recorder.gaps) == (199_999, 0, 1)
+    assert recorder._low[0] == 200_000
+    assert recorder._ahead[0] == set()
+
+
+def test_run_load_test():
+    rate, duration = 2000, 0.5
+    report = run_load_test(producers=2, consumers=2, rate=rate, duration=duration)
+
+    assert 0.8 * rate * duration <= report["produced"] <= 1.1 * rate * duration
+    assert 0.8 * rate <= report["produce_rate"] <= 1.1 * rate
+    assert report["consumed"] == report["produced"]
+    assert report["duplicated"] == 0
+    assert report["gaps"] == 0
+    assert report["dropped"] == 0
+    assert report["latency_ms"]["p50"] is not None
+
+
+def test_cli_load(capsys):
+    assert main(["load", "--broker", "spsc", "--duration", "0.2"]) == 0
+    report = json.loads(capsys.readouterr().out)
+    assert report["config"]["broker"] == "spsc"
+    assert report["consumed"] == report["produced"]
+
+    assert main(["load", "--broker", "spsc", "--producers", "2"]) == 2
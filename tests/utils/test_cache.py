@@ -0,0 +1,37 @@
+from mqflow.utils import TTLCache
+
+
+def test_ttl_cache():
+    now = [0.0]
+    cache = TTLCache(maxsize=2, ttl=10, timer=lambda: now[0])
+
+    assert cache.add("a") is True
+    assert cache.add("a") is False
+    assert cache.add("b") is True
+    assert cache.add("c") is True
+    assert len(cache) == 2
+    assert "b" in cache and "c" in cache
+    assert (cache.hits, cache.misses) == (1, 3)
+
+    now[0] = 11.0
+    assert "b" not in cache
+    assert cache.add("b") is True
+    assert len(cache) == 1
+
+
+def test_ttl_cache_generations():
+    cache = TTLCache(maxsize=100, generations=4)
+    for key in range(200):
+        assert cache.add(key) is True
+
+    assert 75 <= len(cache) <= 100
+    assert all(key in cache for key in range(175, 200))
+    assert 0 not in cache
+
+    # Refreshing a key moves it forward without piling up empty generations.
+    for _ in range(1000):
+        cache.add(180)
+        cache.add(199)
+    assert len(cache._data) <= 5
+    cache.discard(180)
+    assert 180 not in cache